@@ -2,38 +2,53 @@ import os
 import google.auth
 from google.adk.agents import Agent
 from google.adk.apps.app import App
+from google.adk.planners import BuiltInPlanner
+from google.genai import types as genai_types
 
 # --- Configuration ---
-# Use default project from credentials if not in .env
-try:
-    _, project_id = google.auth.default()
-    os.environ.setdefault("GOOGLE_CLOUD_PROJECT", project_id)
-except Exception:
-    # If no credentials available, continue without setting project
-    pass
+# Use default project from credentials if not in .env. Skip the credential
+# lookup entirely when the project is already configured, since
+# google.auth.default() may hit the metadata server on every cold start.
+if "GOOGLE_CLOUD_PROJECT" not in os.environ:
+    try:
+        _, project_id = google.auth.default()
+        if project_id:
+            os.environ["GOOGLE_CLOUD_PROJECT"] = project_id
+    except Exception:
+        # If no credentials available, continue without setting project
+        pass
 
 os.environ.setdefault("GOOGLE_CLOUD_LOCATION", "us-central1")
 os.environ.setdefault("GOOGLE_GENAI_USE_VERTEXAI", "True")
 
-MODEL = "gemini-2.5-pro"
+# Flash is sufficient for formatting already-approved research; PREMIUM_MODE keeps Pro available for A/B evaluation.
+PREMIUM_MODE = os.environ.get("PREMIUM_MODE", "false").lower() == "true"
+MODEL = "gemini-2.5-pro" if PREMIUM_MODE else "gemini-2.5-flash"
+# Thinking counts towards the output limit, so cap it to leave most of the
+# budget for the course itself (both 2.5 Flash and Pro accept this budget).
+THINKING_BUDGET = 1024
+MAX_OUTPUT_TOKENS = 8192
+
+# --- Instructions ---
+CONTENT_BUILDER_INSTRUCTION = (
+    "You are an expert course creator. Turn the approved 'research_findings' into a well-structured, "
+    "engaging course module that addresses the user's original request. Start with a single `#` title, "
+    "use `##` for main sections (used for the Table of Contents), bullet points and clear paragraphs, "
+    "in a professional but engaging tone."
+)
 
 # --- Content Builder Agent ---
 content_builder = Agent(
     name="content_builder",
     model=MODEL,
     description="Transforms research findings into a structured course.",
-    instruction="""
-    You are an expert course creator.
-    Take the approved 'research_findings' and transform them into a well-structured, engaging course module.
-    
-    **Formatting Rules:**
-    1. Start with a main title using a single `#` (H1).
-    2. Use `##` (H2) for main section headings. These will be used for the Table of Contents.
-    3. Use bullet points and clear paragraphs.
-    4. Maintain a professional but engaging tone.
-    
-    Ensure the content directly addresses the user's original request.
-    """,
+    instruction=CONTENT_BUILDER_INSTRUCTION,
+    generate_content_config=genai_types.GenerateContentConfig(
+        max_output_tokens=MAX_OUTPUT_TOKENS,
+    ),
+    planner=BuiltInPlanner(
+        thinking_config=genai_types.ThinkingConfig(thinking_budget=THINKING_BUDGET),
+    ),
 )
 
 app = App(root_agent=content_builder, name="content_builder")
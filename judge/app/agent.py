@@ -3,21 +3,38 @@ from typing import Literal
 import google.auth
 from google.adk.agents import Agent
 from google.adk.apps.app import App
+from google.adk.planners import BuiltInPlanner
+from google.genai import types as genai_types
 from pydantic import BaseModel, Field
 
 # --- Configuration ---
-# Use default project from credentials if not in .env
-try:
-    _, project_id = google.auth.default()
-    os.environ.setdefault("GOOGLE_CLOUD_PROJECT", project_id)
-except Exception:
-    # If no credentials available, continue without setting project
-    pass
+# Use default project from credentials if not in .env. Skip the credential
+# lookup entirely when the project is already configured, since
+# google.auth.default() may hit the metadata server on every cold start.
+if "GOOGLE_CLOUD_PROJECT" not in os.environ:
+    try:
+        _, project_id = google.auth.default()
+        if project_id:
+            os.environ["GOOGLE_CLOUD_PROJECT"] = project_id
+    except Exception:
+        # If no credentials available, continue without setting project
+        pass
 
 os.environ.setdefault("GOOGLE_CLOUD_LOCATION", "us-central1")
 os.environ.setdefault("GOOGLE_GENAI_USE_VERTEXAI", "True")
 
 MODEL = "gemini-2.5-pro"
+# The verdict is two short JSON fields, so keep generation (and thinking, which
+# counts towards the output limit) small. 128 is the lowest budget 2.5 Pro accepts.
+THINKING_BUDGET = 128
+MAX_OUTPUT_TOKENS = 512
+
+# --- Instructions ---
+JUDGE_INSTRUCTION = (
+    "You are a strict editor and fact-checker. Evaluate the 'research_findings' against the "
+    "user's original request. Output status='pass' if they are sufficient for a high-quality course; "
+    "otherwise output status='fail' with brief, specific 'feedback' on what to research next."
+)
 
 # --- Data Models ---
 class JudgeFeedback(BaseModel):
@@ -27,7 +44,7 @@ class JudgeFeedback(BaseModel):
         description="Whether the research is sufficient ('pass') or needs more work ('fail')."
     )
     feedback: str = Field(
-        description="Detailed feedback on what is missing or needs clarification if status is 'fail'. If 'pass', a brief confirmation."
+        description="If 'fail', a brief note on what is missing or unclear. If 'pass', a one-line confirmation."
     )
 
 # --- Judge Agent ---
@@ -35,14 +52,15 @@ judge = Agent(
     name="judge",
     model=MODEL,
     description="Evaluates research findings for completeness and accuracy.",
-    instruction="""
-    You are a strict editor and fact-checker.
-    Evaluate the 'research_findings' against the user's original request.
-    Determine if the findings are sufficient to create a high-quality course.
-    If they are good enough, output status='pass'.
-    If they are missing key information, are too vague, or likely inaccurate, output status='fail' and provide specific, constructive 'feedback' on what to research next.
-    """,
+    instruction=JUDGE_INSTRUCTION,
     output_schema=JudgeFeedback,
+    generate_content_config=genai_types.GenerateContentConfig(
+        response_mime_type="application/json",
+        max_output_tokens=MAX_OUTPUT_TOKENS,
+    ),
+    planner=BuiltInPlanner(
+        thinking_config=genai_types.ThinkingConfig(thinking_budget=THINKING_BUDGET),
+    ),
     # Disallow transfers as it uses output_schema
     disallow_transfer_to_parent=True,
     disallow_transfer_to_peers=True,
@@ -0,0 +1,99 @@
+import logging
+import uuid
+
+from a2a.server.agent_execution.agent_executor import AgentExecutor
+from a2a.server.agent_execution.context import RequestContext
+from a2a.server.events.event_queue import EventQueue
+from a2a.types import Message, TextPart
+from google.genai import types as genai_types
+
+logger = logging.getLogger(__name__)
+
+
+class AdkToA2aExecutor(AgentExecutor):
+    def __init__(self, runner, app_name):
+        self.runner = runner
+        self.app_name = app_name
+
+    async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
+        # 1. Extract User/Session
+        user_id = "default_user"
+        # Fix: ServerCallContext does not have raw_headers. Check user object or state.
+        if context.call_context:
+            if hasattr(context.call_context, "user") and context.call_context.user:
+                 # If it's an authenticated user object, it might have an id
+                 if hasattr(context.call_context.user, "id") and context.call_context.user.id:
+                     user_id = context.call_context.user.id
+
+            # Fallback: check state for potential headers or info
+            if user_id == "default_user" and context.call_context.state:
+                 user_id = context.call_context.state.get("user_id", "default_user")
+
+        session_id = context.context_id or "default_session"
+
+        # 2. Convert Input
+        user_text = ""
+        if context.message and context.message.parts:
+            for part in context.message.parts:
+                # Direct TextPart
+                if isinstance(part, TextPart):
+                    user_text += part.text
+                # Wrapped TextPart (RootModel)
+                elif hasattr(part, "root") and isinstance(part.root, TextPart):
+                    user_text += part.root.text
+                # Fallbacks
+                else:
+                    try:
+                        if hasattr(part, 'text'):
+                            user_text += part.text
+                        elif isinstance(part, dict) and 'text' in part:
+                            user_text += part['text']
+                    except Exception as e:
+                        logger.error(f"[{self.app_name}] Error extracting text: {e}")
+
+        adk_msg = genai_types.Content(
+            role="user", parts=[genai_types.Part.from_text(text=user_text)]
+        )
+
+        logger.info(f"[{self.app_name}] Executing task for user={user_id} session={session_id}")
+
+        # 3. Get/Create Session
+        try:
+            session = await self.runner.session_service.get_session(
+                session_id=session_id, app_name=self.app_name, user_id=user_id
+            )
+        except Exception:
+            session = None
+
+        if not session:
+            session = await self.runner.session_service.create_session(
+                app_name=self.app_name, user_id=user_id, session_id=session_id
+            )
+
+        # 4. Run Agent
+        # A Message is a final event for the A2A request handler, so only the
+        # agent's last text output is sent back, as a single Message.
+        final_text = ""
+        async for event in self.runner.run_async(
+            user_id=user_id, session_id=session.id, new_message=adk_msg
+        ):
+             if event.content and event.content.parts:
+                 text_content = ""
+                 for p in event.content.parts:
+                     if p.text and not p.thought:
+                         text_content += p.text
+
+                 if text_content:
+                    final_text = text_content
+
+        # 5. Send Output
+        if final_text:
+            a2a_msg = Message(
+                messageId=str(uuid.uuid4()),
+                role="agent",
+                parts=[TextPart(text=final_text)]
+            )
+            await event_queue.enqueue_event(a2a_msg)
+
+    async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
+        pass
@@ -0,0 +1,40 @@
+import copy
+
+from google.adk.sessions import InMemorySessionService, Session
+from google.adk.sessions.base_session_service import GetSessionConfig
+
+
+class DeltaSessionService(InMemorySessionService):
+    """In-memory session service that doesn't deep-copy the event history on reads.
+
+    Stored events are only ever appended, never mutated, so reads share the
+    stored Event objects and copy just the event list and state. Reading a
+    session no longer costs time proportional to the size of its history.
+
+    Overrides InMemorySessionService internals (`sessions`, `_merge_state`) as
+    of google-adk 1.18, hence the version floor in pyproject.toml.
+    """
+
+    def _get_session_impl(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: GetSessionConfig | None = None,
+    ) -> Session | None:
+        session = self.sessions.get(app_name, {}).get(user_id, {}).get(session_id)
+        if session is None:
+            return None
+
+        events = session.events
+        if config:
+            if config.num_recent_events:
+                events = events[-config.num_recent_events:]
+            if config.after_timestamp:
+                events = [e for e in events if e.timestamp >= config.after_timestamp]
+
+        copied_session = session.model_copy(
+            update={"events": list(events), "state": copy.deepcopy(session.state)}
+        )
+        return self._merge_state(app_name, user_id, copied_session)
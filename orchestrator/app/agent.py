@@ -1,12 +1,24 @@
 import os
-import json
+import hashlib
+import importlib
+import itertools
+import logging
+import sys
 import warnings
+from pathlib import Path
 from typing import AsyncGenerator, Any
 import google.auth
+import httpx
+import orjson
+from a2a.client import ClientConfig as A2AClientConfig, ClientFactory as A2AClientFactory
+from a2a.types import TransportProtocol
 from google.adk.agents import BaseAgent, LoopAgent, SequentialAgent
 
-# Suppress experimental warnings for A2A components
-warnings.filterwarnings("ignore", message=".*\[EXPERIMENTAL\].*", category=UserWarning)
+# Suppress experimental warnings for A2A components. The env var skips ADK's
+# @experimental warnings; the A2A classes use their own decorator, which ignores
+# it, so their warnings are filtered by their "[EXPERIMENTAL]" prefix.
+os.environ.setdefault("ADK_SUPPRESS_EXPERIMENTAL_FEATURE_WARNINGS", "true")
+warnings.filterwarnings("ignore", message=r"\[EXPERIMENTAL\]", category=UserWarning)
 
 from google.adk.apps.app import App
 from google.adk.events import Event, EventActions
@@ -14,14 +26,23 @@ from google.adk.agents.invocation_context import InvocationContext
 from google.adk.agents.remote_a2a_agent import RemoteA2aAgent
 from google.adk.agents.callback_context import CallbackContext
 
+from app.local_agent import LocalAgent
+from app.semantic_cache import SemanticCacheAgent
+
+logger = logging.getLogger(__name__)
+
 # --- Configuration ---
-# Use default project from credentials if not in .env
-try:
-    _, project_id = google.auth.default()
-    os.environ.setdefault("GOOGLE_CLOUD_PROJECT", project_id)
-except Exception:
-    # If no credentials available, continue without setting project
-    pass
+# Use default project from credentials if not in .env. Skip the credential
+# lookup entirely when the project is already configured, since
+# google.auth.default() may hit the metadata server on every cold start.
+if "GOOGLE_CLOUD_PROJECT" not in os.environ:
+    try:
+        _, project_id = google.auth.default()
+        if project_id:
+            os.environ["GOOGLE_CLOUD_PROJECT"] = project_id
+    except Exception:
+        # If no credentials available, continue without setting project
+        pass
 
 os.environ.setdefault("GOOGLE_CLOUD_LOCATION", "us-central1")
 os.environ.setdefault("GOOGLE_GENAI_USE_VERTEXAI", "True")
@@ -30,90 +51,220 @@ os.environ.setdefault("GOOGLE_GENAI_USE_VERTEXAI", "True")
 
 
 # --- Callbacks ---
+# Maximum number of trailing session events inspected when saving an agent's output.
+_OUTPUT_SCAN_LIMIT = 16
+
+def _parse_judge_feedback(text: str) -> dict:
+    """Normalizes the judge's response into a {"status", "feedback"} dict."""
+    try:
+        feedback = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        feedback = None
+    if not isinstance(feedback, dict):
+        # Anything that isn't a JSON verdict is treated as a failed evaluation
+        feedback = {"status": "fail", "feedback": text}
+    return feedback
+
 def create_save_output_callback(key: str):
     """Creates a callback to save the agent's final response to session state."""
     def callback(callback_context: CallbackContext, **kwargs) -> None:
         ctx = callback_context
-        # Find the last event from this agent that has content
-        for event in reversed(ctx.session.events):
-            if event.author == ctx.agent_name and event.content and event.content.parts:
+        agent_name = ctx.agent_name
+        # Find the last event from this agent that has content. The agent has
+        # just finished, so its final event is always near the tail.
+        for event in itertools.islice(reversed(ctx.session.events), _OUTPUT_SCAN_LIMIT):
+            if event.author == agent_name and event.content and event.content.parts:
+                # Thought parts are not part of the agent's result
+                if event.content.parts[0].thought:
+                    continue
                 text = event.content.parts[0].text
                 if text:
-                    # Try to parse as JSON if it looks like it, for judge_feedback
-                    if key == "judge_feedback" and text.strip().startswith("{"):
-                        try:
-                            ctx.state[key] = json.loads(text)
-                        except json.JSONDecodeError:
-                            ctx.state[key] = text
+                    # Always store judge_feedback as a dict so checks are a single lookup
+                    if key == "judge_feedback":
+                        ctx.state[key] = _parse_judge_feedback(text)
                     else:
                         ctx.state[key] = text
-                    print(f"[{ctx.agent_name}] Saved output to state['{key}']")
+                    logger.debug("[%s] Saved output to state['%s']", agent_name, key)
                     return
     return callback
 
 # --- Remote Agents ---
 # These agents are running in their own containers. We connect to them via A2A.
 
+# A single pooled client is shared by all remote agents so keep-alive connections
+# (and HTTP/2 multiplexing) are reused across pipeline stages instead of each
+# agent opening its own connections.
+shared_httpx_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+    http2=True,
+    timeout=httpx.Timeout(600.0),
+)
+
+# The leaf servers answer each request with a single Message, so there is nothing
+# to stream; the factory hands the pooled client to every remote agent.
+a2a_client_factory = A2AClientFactory(
+    config=A2AClientConfig(
+        httpx_client=shared_httpx_client,
+        streaming=False,
+        supported_transports=[TransportProtocol.jsonrpc],
+    )
+)
+
+# Local development only: with AGENTS_INPROC=1 the leaf agents are imported from
+# the sibling service directories and run in this process, bypassing HTTP.
+AGENTS_INPROC = os.environ.get("AGENTS_INPROC") == "1"
+if AGENTS_INPROC:
+    sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+def create_leaf_agent(name: str, agent_card_url: str, description: str, **kwargs) -> BaseAgent:
+    """Connects to a leaf agent over A2A, or wraps it in-process when AGENTS_INPROC=1."""
+    if AGENTS_INPROC:
+        leaf_app = importlib.import_module(f"{name}.app.agent").app
+        return LocalAgent(name=name, app=leaf_app, description=description, **kwargs)
+    return RemoteA2aAgent(
+        name=name,
+        agent_card=agent_card_url,
+        a2a_client_factory=a2a_client_factory,
+        description=description,
+        **kwargs,
+    )
+
 # Default URLs assume local running on different ports if env vars are not set.
 # Note: We use the agent card URL (e.g., http://localhost:8001/.well-known/agent.json) for discovery.
 researcher_url = os.environ.get("RESEARCHER_AGENT_CARD_URL", "http://localhost:8001/.well-known/agent.json")
-researcher = RemoteA2aAgent(
+researcher = create_leaf_agent(
     name="researcher",
-    agent_card=researcher_url,
+    agent_card_url=researcher_url,
     description="Gathers information on a topic using Google Search.",
     after_agent_callback=create_save_output_callback("research_findings")
 )
 
 judge_url = os.environ.get("JUDGE_AGENT_CARD_URL", "http://localhost:8002/.well-known/agent.json")
-judge = RemoteA2aAgent(
+judge = create_leaf_agent(
     name="judge",
-    agent_card=judge_url,
+    agent_card_url=judge_url,
     description="Evaluates research findings for completeness and accuracy.",
     after_agent_callback=create_save_output_callback("judge_feedback")
 )
 
 content_builder_url = os.environ.get("CONTENT_BUILDER_AGENT_CARD_URL", "http://localhost:8003/.well-known/agent.json")
-content_builder = RemoteA2aAgent(
+content_builder = create_leaf_agent(
     name="content_builder",
-    agent_card=content_builder_url,
+    agent_card_url=content_builder_url,
     description="Transforms research findings into a structured course."
 )
 
 # --- Local Orchestration Agents ---
 
-class EscalationChecker(BaseAgent):
-    """Checks the judge's feedback and escalates (breaks the loop) if it passed."""
+class DedupGate(BaseAgent):
+    """Escalates (breaks the loop) if the research findings didn't change since the last iteration.
+
+    Re-judging identical findings would only repeat the previous verdict, so the
+    judge call is skipped for a stalled iteration. Findings are only compared when
+    `findings_agent_name` produced a result in this iteration; after an error or an
+    empty response, `research_findings` still holds the previous iteration's text.
+    """
+
+    findings_agent_name: str = "researcher"
+
+    def _has_new_findings(self, ctx: InvocationContext) -> bool:
+        # Events since this gate last ran in the current invocation
+        for event in reversed(ctx.session.events):
+            if event.invocation_id != ctx.invocation_id or event.author == self.name:
+                return False
+            if event.author == self.findings_agent_name and event.content and event.content.parts:
+                part = event.content.parts[0]
+                if part.text and not part.thought:
+                    return True
+        return False
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        if not self._has_new_findings(ctx):
+            logger.debug("[%s] No new research findings, nothing to compare", self.name)
+            return
+
+        findings = ctx.session.state.get("research_findings") or ""
+        findings_hash = hashlib.blake2b(findings.encode(), digest_size=16).hexdigest()
+        # Scoped to the invocation so findings from an earlier request never match
+        current = {"invocation_id": ctx.invocation_id, "hash": findings_hash}
+
+        if ctx.session.state.get("_last_findings_hash") == current:
+            logger.debug("[%s] Research findings unchanged, skipping judge", self.name)
+            yield Event(author=self.name, actions=EventActions(escalate=True))
+        else:
+            yield Event(
+                author=self.name,
+                actions=EventActions(state_delta={"_last_findings_hash": current}),
+            )
+
+dedup_gate = DedupGate(name="dedup_gate", findings_agent_name=researcher.name)
+
+class JudgeAndCheck(BaseAgent):
+    """Runs the judge and escalates (breaks the loop) in the same step if it passed.
+
+    Only a verdict the judge produced in this step counts; after an error or an
+    empty response, `judge_feedback` still holds an earlier verdict.
+    """
 
     async def _run_async_impl(
         self, ctx: InvocationContext
     ) -> AsyncGenerator[Event, None]:
+        # Running the judge through run_async keeps its after_agent_callback,
+        # so judge_feedback is in state by the time the loop below finishes.
+        judged = False
+        for sub_agent in self.sub_agents:
+            async for event in sub_agent.run_async(ctx):
+                if event.author == sub_agent.name and event.content and event.content.parts:
+                    part = event.content.parts[0]
+                    judged = judged or bool(part.text and not part.thought)
+                yield event
+
+        if not judged:
+            logger.debug("[%s] No verdict from the judge in this step", self.name)
+            return
+
         feedback = ctx.session.state.get("judge_feedback")
 
         # Debug log to see what we got from the remote agent
-        print(f"[EscalationChecker] Feedback received: {feedback}")
+        logger.debug("[%s] Feedback received: %s", self.name, feedback)
 
-        if feedback and isinstance(feedback, dict) and feedback.get("status") == "pass":
+        # judge_feedback is normalized to a dict when it is saved. LoopAgent only
+        # acts on escalation, so nothing is yielded when the research failed.
+        if isinstance(feedback, dict) and feedback.get("status") == "pass":
             yield Event(author=self.name, actions=EventActions(escalate=True))
-        elif isinstance(feedback, str) and '"status": "pass"' in feedback:
-             yield Event(author=self.name, actions=EventActions(escalate=True))
-        else:
-            yield Event(author=self.name)
 
-escalation_checker = EscalationChecker(name="escalation_checker")
+judge_and_check = JudgeAndCheck(
+    name="judge_and_check",
+    description="Evaluates research findings and stops the loop once they pass.",
+    sub_agents=[judge],
+)
 
 # --- Orchestration ---
 
 research_loop = LoopAgent(
     name="research_loop",
     description="Iteratively researches and judges until quality standards are met.",
-    sub_agents=[researcher, judge, escalation_checker],
+    sub_agents=[researcher, dedup_gate, judge_and_check],
     max_iterations=3,
 )
 
-root_agent = SequentialAgent(
+course_creation_pipeline = SequentialAgent(
     name="course_creation_pipeline",
     description="A pipeline that researches a topic and then builds a course from it.",
     sub_agents=[research_loop, content_builder],
 )
 
+# Short-circuits the whole pipeline when a semantically similar course was already built.
+root_agent = SemanticCacheAgent(
+    name="semantic_cache",
+    description="Returns a cached course for similar requests, otherwise runs the pipeline.",
+    sub_agents=[course_creation_pipeline],
+    output_agent_name=content_builder.name,
+    similarity_threshold=float(os.environ.get("COURSE_CACHE_SIMILARITY", "0.92")),
+    ttl_seconds=int(os.environ.get("COURSE_CACHE_TTL_SECONDS", "86400")),
+    db_path=os.environ.get("COURSE_CACHE_PATH", "/tmp/course_cache.db"),
+)
+
 app = App(root_agent=root_agent, name="orchestrator_app")
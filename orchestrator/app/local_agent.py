@@ -0,0 +1,94 @@
+import logging
+from collections.abc import AsyncGenerator
+
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.apps.app import App
+from google.adk.events import Event
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types as genai_types
+from pydantic import PrivateAttr
+
+logger = logging.getLogger(__name__)
+
+
+class LocalAgent(BaseAgent):
+    """Runs another ADK app in-process, as a drop-in for its RemoteA2aAgent.
+
+    The wrapped app gets its own Runner and session, like it would in its own
+    container, but is called directly instead of over HTTP. Intended for local
+    development only.
+    """
+
+    _runner: Runner = PrivateAttr()
+
+    def __init__(self, name: str, app: App, description: str = "", **kwargs):
+        super().__init__(name=name, description=description, **kwargs)
+        self._runner = Runner(app=app, session_service=InMemorySessionService())
+
+    def _build_message(self, ctx: InvocationContext) -> str:
+        """Collects what happened since this agent last replied, like RemoteA2aAgent does."""
+        events = []
+        for event in reversed(ctx.session.events):
+            if event.author == self.name:
+                break
+            events.append(event)
+
+        lines = []
+        for event in reversed(events):
+            if not event.content or not event.content.parts:
+                continue
+            texts = [p.text for p in event.content.parts if p.text and not p.thought]
+            if not texts:
+                continue
+            if event.author == "user":
+                lines.extend(texts)
+            else:
+                lines.append("For context:")
+                lines.extend(f"[{event.author}] said: {text}" for text in texts)
+        return "\n".join(lines)
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        message = self._build_message(ctx)
+        if not message:
+            logger.warning(f"[{self.name}] No message found to send.")
+            return
+
+        runner = self._runner
+        user_id = ctx.session.user_id
+        session_id = ctx.session.id
+        session = await runner.session_service.get_session(
+            app_name=runner.app_name, user_id=user_id, session_id=session_id
+        )
+        if not session:
+            session = await runner.session_service.create_session(
+                app_name=runner.app_name, user_id=user_id, session_id=session_id
+            )
+
+        new_message = genai_types.Content(
+            role="user", parts=[genai_types.Part.from_text(text=message)]
+        )
+
+        # Same shape as the A2A servers: only the last text is sent back, as a
+        # single reply.
+        final_text = ""
+        async for event in runner.run_async(
+            user_id=user_id, session_id=session.id, new_message=new_message
+        ):
+            if event.content and event.content.parts:
+                text = "".join(p.text for p in event.content.parts if p.text and not p.thought)
+                if text:
+                    final_text = text
+
+        if final_text:
+            yield Event(
+                author=self.name,
+                invocation_id=ctx.invocation_id,
+                branch=ctx.branch,
+                content=genai_types.Content(
+                    role="model", parts=[genai_types.Part.from_text(text=final_text)]
+                ),
+            )
@@ -0,0 +1,166 @@
+import asyncio
+import logging
+import math
+import sqlite3
+import time
+from array import array
+from collections.abc import AsyncGenerator
+from contextlib import closing
+
+from google import genai
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+from google.genai import types as genai_types
+from pydantic import PrivateAttr
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL = "text-embedding-004"
+# The frontend wraps every topic in this fixed wording (see frontend/app.js).
+COURSE_PROMPT_PREFIX = "Create a comprehensive course on:"
+
+
+def course_topic(prompt: str) -> str:
+    """Returns the topic of a course request, without the frontend's fixed wording."""
+    prompt = prompt.strip()
+    if prompt.lower().startswith(COURSE_PROMPT_PREFIX.lower()):
+        prompt = prompt[len(COURSE_PROMPT_PREFIX):].strip()
+    return prompt
+
+
+class SemanticCacheAgent(BaseAgent):
+    """Serves previously generated courses for semantically similar requests.
+
+    The requested topic is embedded and compared (cosine similarity) against the
+    topics of earlier runs. On a hit, the cached course is returned without
+    invoking the wrapped pipeline. On a miss, the pipeline runs as usual and
+    the output of `output_agent_name` is stored for future requests, but only
+    if the verdict saved under `verdict_key` passed.
+
+    Only the first turn of a session is cached: later turns (e.g. "make it
+    shorter") depend on the conversation so far and always run the pipeline.
+    """
+
+    output_agent_name: str = "content_builder"
+    verdict_key: str = "judge_feedback"
+    similarity_threshold: float = 0.92
+    ttl_seconds: int = 24 * 60 * 60
+    db_path: str = "/tmp/course_cache.db"
+    _client: genai.Client | None = PrivateAttr(default=None)
+    _table_ready: bool = PrivateAttr(default=False)
+
+    def _get_client(self) -> genai.Client:
+        # Created lazily so importing the agent doesn't require credentials.
+        if self._client is None:
+            self._client = genai.Client()
+        return self._client
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        if not self._table_ready:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS course_cache ("
+                    " id INTEGER PRIMARY KEY,"
+                    " embedding BLOB NOT NULL,"
+                    " content TEXT NOT NULL,"
+                    " created_at REAL NOT NULL)"
+                )
+            self._table_ready = True
+        return conn
+
+    async def _embed(self, text: str) -> array:
+        response = await self._get_client().aio.models.embed_content(
+            model=EMBEDDING_MODEL, contents=text
+        )
+        vector = array("f", response.embeddings[0].values)
+        # Normalize so the inner product is the cosine similarity.
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return array("f", (v / norm for v in vector))
+
+    def _lookup(self, embedding: array) -> str | None:
+        best_score, best_content = 0.0, None
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT embedding, content FROM course_cache WHERE created_at >= ?",
+                (time.time() - self.ttl_seconds,),
+            )
+            for blob, content in rows:
+                cached = array("f")
+                cached.frombytes(blob)
+                if len(cached) != len(embedding):
+                    # Stored by a different embedding model; not comparable
+                    continue
+                score = sum(a * b for a, b in zip(embedding, cached, strict=True))
+                if score > best_score:
+                    best_score, best_content = score, content
+        if best_score >= self.similarity_threshold:
+            logger.info(f"[{self.name}] Cache hit (similarity={best_score:.3f})")
+            return best_content
+        return None
+
+    def _store(self, embedding: array, content: str) -> None:
+        now = time.time()
+        # `with conn` only scopes the transaction; closing() releases the connection.
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "DELETE FROM course_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+            )
+            conn.execute(
+                "INSERT INTO course_cache (embedding, content, created_at) VALUES (?, ?, ?)",
+                (embedding.tobytes(), content, now),
+            )
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        topic = ""
+        if ctx.user_content and ctx.user_content.parts:
+            topic = course_topic(
+                "".join(part.text for part in ctx.user_content.parts if part.text)
+            )
+        first_turn = all(
+            event.invocation_id == ctx.invocation_id for event in ctx.session.events
+        )
+
+        embedding = None
+        if topic and first_turn:
+            try:
+                embedding = await self._embed(topic)
+                cached = await asyncio.to_thread(self._lookup, embedding)
+            except Exception as e:
+                logger.warning(f"[{self.name}] Cache lookup failed: {e}")
+                embedding, cached = None, None
+
+            if cached:
+                yield Event(
+                    author=self.name,
+                    invocation_id=ctx.invocation_id,
+                    content=genai_types.Content(
+                        role="model", parts=[genai_types.Part.from_text(text=cached)]
+                    ),
+                )
+                return
+
+        # Only the output agent's last non-thought text is the result.
+        output = ""
+        for sub_agent in self.sub_agents:
+            async for event in sub_agent.run_async(ctx):
+                if event.author == self.output_agent_name and event.content and event.content.parts:
+                    text = "".join(
+                        part.text for part in event.content.parts if part.text and not part.thought
+                    )
+                    if text:
+                        output = text
+                yield event
+
+        # A course built after the research loop gave up without a pass is served
+        # once, but never cached.
+        verdict = ctx.session.state.get(self.verdict_key)
+        passed = isinstance(verdict, dict) and verdict.get("status") == "pass"
+        if embedding is not None and output.strip() and passed:
+            try:
+                await asyncio.to_thread(self._store, embedding, output)
+            except Exception as e:
+                logger.warning(f"[{self.name}] Failed to store cache entry: {e}")
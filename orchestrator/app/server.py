@@ -5,8 +5,11 @@ import warnings
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
-# Suppress experimental warnings for A2A components
-warnings.filterwarnings("ignore", message=r".*\[EXPERIMENTAL\].*", category=UserWarning)
+# Suppress experimental warnings for A2A components. The env var skips ADK's
+# @experimental warnings; the A2A classes use their own decorator, which ignores
+# it, so their warnings are filtered by their "[EXPERIMENTAL]" prefix.
+os.environ.setdefault("ADK_SUPPRESS_EXPERIMENTAL_FEATURE_WARNINGS", "true")
+warnings.filterwarnings("ignore", message=r"\[EXPERIMENTAL\]", category=UserWarning)
 
 # Suppress runner app name mismatch warning
 logging.getLogger("google_adk.google.adk.runners").setLevel(logging.ERROR)
@@ -28,7 +31,7 @@ from opentelemetry.sdk.trace import TracerProvider, export
 from opentelemetry.sdk.trace.export import ConsoleSpanExporter
 from pydantic import BaseModel
 
-from app.agent import app as adk_app
+from app.agent import app as adk_app, shared_httpx_client
 
 class Feedback(BaseModel):
     score: float
@@ -51,6 +54,10 @@ runner = Runner(
 
 app = FastAPI()
 
+@app.on_event("shutdown")
+async def close_httpx_client() -> None:
+    await shared_httpx_client.aclose()
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -97,10 +104,10 @@ async def chat_stream(request: SimpleChatRequest):
             elif event.author == "content_builder":
                  yield json.dumps({"type": "progress", "text": "✍️ Content Builder is writing the course..."}) + "\n"
 
-            # Accumulate final text
+            # Accumulate final text (thought parts are not part of the result)
             if event.content and event.content.parts:
                 for part in event.content.parts:
-                    if part.text:
+                    if part.text and not part.thought:
                         final_text += part.text
 
         # Send final result
@@ -1,6 +1,6 @@
 import logging
 import httpx
-from typing import AsyncGenerator, Any, Optional
+from typing import AsyncGenerator, Any
 
 from google.adk.agents import BaseAgent
 from google.adk.agents.invocation_context import InvocationContext
@@ -23,11 +23,13 @@ class SimpleRemoteAgent(BaseAgent):
         base_url: str,
         description: str = "",
         model: str = "", # Not used, but kept for compatibility
+        client: httpx.AsyncClient | None = None,
         **kwargs
     ):
         super().__init__(name=name, description=description, base_url=base_url, **kwargs)
         self.base_url = base_url.rstrip("/")
-        self._client = httpx.AsyncClient(timeout=60.0)
+        # Reuse a shared pooled client when given, so connections are kept alive across agents
+        self._client = client or httpx.AsyncClient(timeout=60.0)
 
     @property
     def client(self):
@@ -5,30 +5,36 @@ from google.adk.apps.app import App
 from google.adk.tools import google_search
 
 # --- Configuration ---
-# Use default project from credentials if not in .env
-try:
-    _, project_id = google.auth.default()
-    os.environ.setdefault("GOOGLE_CLOUD_PROJECT", project_id)
-except Exception:
-    # If no credentials available, continue without setting project
-    pass
+# Use default project from credentials if not in .env. Skip the credential
+# lookup entirely when the project is already configured, since
+# google.auth.default() may hit the metadata server on every cold start.
+if "GOOGLE_CLOUD_PROJECT" not in os.environ:
+    try:
+        _, project_id = google.auth.default()
+        if project_id:
+            os.environ["GOOGLE_CLOUD_PROJECT"] = project_id
+    except Exception:
+        # If no credentials available, continue without setting project
+        pass
 
 os.environ.setdefault("GOOGLE_CLOUD_LOCATION", "europe-west1")
 os.environ.setdefault("GOOGLE_GENAI_USE_VERTEXAI", "True")
 
 MODEL = "gemini-2.5-pro"
 
+# --- Instructions ---
+RESEARCHER_INSTRUCTION = (
+    "You are an expert researcher. Use the `google_search` tool to find comprehensive, "
+    "accurate information on the user's topic and summarize your findings clearly. "
+    "If you receive feedback that your research is insufficient, use it to refine your next search."
+)
+
 # --- Researcher Agent ---
 researcher = Agent(
     name="researcher",
     model=MODEL,
     description="Gathers information on a topic using Google Search.",
-    instruction="""
-    You are an expert researcher. Your goal is to find comprehensive and accurate information on the user's topic.
-    Use the `google_search` tool to find relevant information.
-    Summarize your findings clearly.
-    If you receive feedback that your research is insufficient, use the feedback to refine your next search.
-    """,
+    instruction=RESEARCHER_INSTRUCTION,
     tools=[google_search],
 )
 
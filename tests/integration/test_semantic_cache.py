@@ -0,0 +1,54 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+
+import pytest
+from app.semantic_cache import SemanticCacheAgent, course_topic
+
+# Requests for the same course, as users might phrase them.
+SAME_COURSE = [
+    ("Python for beginners", "python for beginners"),
+    ("Introduction to machine learning", "Intro to machine learning"),
+]
+# Distinct courses that share most of their wording.
+DIFFERENT_COURSES = [
+    "Python for beginners",
+    "JavaScript for beginners",
+    "Introduction to machine learning",
+    "Introduction to organic chemistry",
+]
+
+
+async def similarity(cache: SemanticCacheAgent, a: str, b: str) -> float:
+    ea, eb = await cache._embed(course_topic(a)), await cache._embed(course_topic(b))
+    return sum(x * y for x, y in zip(ea, eb, strict=True))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("a", "b"), SAME_COURSE)
+async def test_same_course_is_above_threshold(a: str, b: str) -> None:
+    cache = SemanticCacheAgent(name="cache")
+
+    assert await similarity(cache, a, b) >= cache.similarity_threshold
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("a", "b"), itertools.combinations(DIFFERENT_COURSES, 2))
+async def test_different_courses_are_below_threshold(a: str, b: str) -> None:
+    cache = SemanticCacheAgent(name="cache")
+    # Requests come from the frontend with its fixed wording around the topic
+    a, b = f"Create a comprehensive course on: {a}", f"Create a comprehensive course on: {b}"
+
+    assert await similarity(cache, a, b) < cache.similarity_threshold
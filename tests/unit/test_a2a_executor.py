@@ -0,0 +1,143 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dataclasses
+import importlib.util
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import httpx
+import pytest
+from a2a.client import ClientFactory
+from a2a.server.apps.jsonrpc.fastapi_app import A2AFastAPIApplication
+from a2a.server.request_handlers.default_request_handler import DefaultRequestHandler
+from a2a.server.tasks.inmemory_task_store import InMemoryTaskStore
+from a2a.types import AgentCard, TransportProtocol
+from app.agent import a2a_client_factory
+from fastapi import FastAPI
+from google.adk.agents import BaseAgent, SequentialAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.remote_a2a_agent import RemoteA2aAgent
+from google.adk.events import Event
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+ROOT = Path(__file__).resolve().parents[2]
+# Each leaf service ships its own copy, since only its app/ goes into its image.
+SERVICES = ["researcher", "judge", "content_builder"]
+
+
+def load_executor(service: str) -> type:
+    path = ROOT / service / "app" / "executor.py"
+    spec = importlib.util.spec_from_file_location(f"{service}_executor", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.AdkToA2aExecutor
+
+
+class EchoAgent(BaseAgent):
+    """Thinks, then replies with a draft and a final answer quoting its input."""
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        prompt = ctx.user_content.parts[0].text
+        replies = [
+            types.Part(text="Thinking...", thought=True),
+            types.Part(text="Draft"),
+            types.Part(text=f"{self.name} got: {prompt}"),
+        ]
+        for part in replies:
+            yield Event(
+                author=self.name,
+                invocation_id=ctx.invocation_id,
+                content=types.Content(role="model", parts=[part]),
+            )
+
+
+def serve(app: FastAPI, executor_cls: type, name: str) -> AgentCard:
+    runner = Runner(
+        app_name=name, agent=EchoAgent(name=name), session_service=InMemorySessionService()
+    )
+    handler = DefaultRequestHandler(
+        agent_executor=executor_cls(runner, name), task_store=InMemoryTaskStore()
+    )
+    # Same card as the leaf servers, apart from the URL
+    card = AgentCard(
+        name=name,
+        description=name,
+        version="0.1.0",
+        protocolVersion="0.1.0",
+        url=f"http://leaves/a2a/{name}",
+        capabilities={},
+        security=[],
+        defaultInputModes=["text"],
+        defaultOutputModes=["text"],
+        skills=[],
+    )
+    A2AFastAPIApplication(agent_card=card, http_handler=handler).add_routes_to_app(
+        app=app, rpc_url=f"/a2a/{name}", agent_card_url=f"/{name}/agent.json"
+    )
+    return card
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("service", SERVICES)
+async def test_remote_agents_chain_over_a2a(service: str) -> None:
+    executor_cls = load_executor(service)
+    leaves = FastAPI()
+    cards = {name: serve(leaves, executor_cls, name) for name in ["researcher", "judge"]}
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=leaves), base_url="http://leaves"
+    ) as client:
+        # The orchestrator's client settings, on a client that reaches the ASGI app
+        config = dataclasses.replace(a2a_client_factory._config, httpx_client=client)
+        assert config.supported_transports == [TransportProtocol.jsonrpc]
+        factory = ClientFactory(config=config)
+        pipeline = SequentialAgent(
+            name="pipeline",
+            sub_agents=[
+                RemoteA2aAgent(name=name, agent_card=card, a2a_client_factory=factory)
+                for name, card in cards.items()
+            ],
+        )
+        runner = Runner(
+            app_name="orchestrator", agent=pipeline, session_service=InMemorySessionService()
+        )
+        session = await runner.session_service.create_session(
+            app_name="orchestrator", user_id="user"
+        )
+        events = [
+            event
+            async for event in runner.run_async(
+                user_id="user",
+                session_id=session.id,
+                new_message=types.Content(role="user", parts=[types.Part(text="Python")]),
+            )
+        ]
+
+    # One reply per remote agent, carrying only the final text
+    replies = [
+        (event.author, [(part.text, part.thought) for part in event.content.parts])
+        for event in events
+    ]
+    assert replies == [
+        ("researcher", [("researcher got: Python", None)]),
+        (
+            "judge",
+            [("judge got: PythonFor context:[researcher] said: researcher got: Python", None)],
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+from app.agent import _parse_judge_feedback
+
+
+def test_valid_verdict_is_returned_as_is() -> None:
+    text = '{"status": "pass", "feedback": "Thorough and accurate."}'
+
+    assert _parse_judge_feedback(text) == {
+        "status": "pass",
+        "feedback": "Thorough and accurate.",
+    }
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "The research looks good.",
+        '{"status": "pass", ',
+        "",
+    ],
+)
+def test_invalid_json_fails_with_raw_text(text: str) -> None:
+    assert _parse_judge_feedback(text) == {"status": "fail", "feedback": text}
+
+
+@pytest.mark.parametrize("text", ['"pass"', '["pass"]', "null", "1"])
+def test_non_dict_json_fails_with_raw_text(text: str) -> None:
+    assert _parse_judge_feedback(text) == {"status": "fail", "feedback": text}
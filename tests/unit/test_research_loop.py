@@ -0,0 +1,136 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import AsyncGenerator
+
+import pytest
+from app.agent import DedupGate, JudgeAndCheck, create_save_output_callback
+from google.adk.agents import BaseAgent, LoopAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+ERROR = None  # A turn that fails without producing any text
+
+
+class ScriptedAgent(BaseAgent):
+    """Replies with the next scripted output on each turn."""
+
+    outputs: list[str | None]
+    turns: int = 0
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        output = self.outputs[min(self.turns, len(self.outputs) - 1)]
+        self.turns += 1
+        if output is ERROR:
+            yield Event(
+                author=self.name,
+                invocation_id=ctx.invocation_id,
+                error_code="A2A_ERROR",
+                error_message="Remote agent unavailable",
+            )
+            return
+        # A thought before the result, which must not be taken for the output
+        for text, thought in [("Working...", True), (output, None)]:
+            yield Event(
+                author=self.name,
+                invocation_id=ctx.invocation_id,
+                content=types.Content(
+                    role="model", parts=[types.Part(text=text, thought=thought)]
+                ),
+            )
+
+
+async def run_loop(
+    findings: list[str | None], verdicts: list[str | None], requests: int = 1
+) -> tuple[ScriptedAgent, ScriptedAgent]:
+    """Runs the research loop for `requests` consecutive requests in one session."""
+    researcher = ScriptedAgent(
+        name="researcher",
+        outputs=findings,
+        after_agent_callback=create_save_output_callback("research_findings"),
+    )
+    judge = ScriptedAgent(
+        name="judge",
+        outputs=[
+            ERROR if verdict is ERROR else f'{{"status": "{verdict}", "feedback": "..."}}'
+            for verdict in verdicts
+        ],
+        after_agent_callback=create_save_output_callback("judge_feedback"),
+    )
+    loop = LoopAgent(
+        name="research_loop",
+        sub_agents=[
+            researcher,
+            DedupGate(name="dedup_gate", findings_agent_name="researcher"),
+            JudgeAndCheck(name="judge_and_check", sub_agents=[judge]),
+        ],
+        max_iterations=3,
+    )
+    runner = Runner(
+        app_name="test", agent=loop, session_service=InMemorySessionService()
+    )
+    session = await runner.session_service.create_session(
+        app_name="test", user_id="user"
+    )
+    for _ in range(requests):
+        async for _ in runner.run_async(
+            user_id="user",
+            session_id=session.id,
+            new_message=types.Content(role="user", parts=[types.Part(text="Python")]),
+        ):
+            pass
+    return researcher, judge
+
+
+@pytest.mark.asyncio
+async def test_changing_findings_are_judged_every_iteration() -> None:
+    researcher, judge = await run_loop(["A", "B", "C"], verdicts=["fail"])
+
+    assert (researcher.turns, judge.turns) == (3, 3)
+
+
+@pytest.mark.asyncio
+async def test_unchanged_findings_stop_the_loop_before_the_judge() -> None:
+    researcher, judge = await run_loop(["A", "A", "A"], verdicts=["fail"])
+
+    assert (researcher.turns, judge.turns) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_pass_stops_the_loop() -> None:
+    researcher, judge = await run_loop(["A", "B", "C"], verdicts=["pass"])
+
+    assert (researcher.turns, judge.turns) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_researcher_error_is_not_mistaken_for_unchanged_findings() -> None:
+    researcher, judge = await run_loop(["A", ERROR, "B"], verdicts=["fail"])
+
+    assert (researcher.turns, judge.turns) == (3, 3)
+
+
+@pytest.mark.asyncio
+async def test_judge_error_does_not_reuse_an_earlier_pass() -> None:
+    # The first request passes; every judge call of the second one fails
+    researcher, judge = await run_loop(
+        ["A", "B", "C", "D"], verdicts=["pass", ERROR], requests=2
+    )
+
+    assert (researcher.turns, judge.turns) == (4, 4)
@@ -0,0 +1,220 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+from array import array
+from collections.abc import AsyncGenerator
+from contextlib import closing
+from types import SimpleNamespace
+
+import pytest
+from app import semantic_cache
+from app.semantic_cache import SemanticCacheAgent, course_topic
+from google.adk.agents import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+# Unit vectors standing in for the embedding model.
+EMBEDDINGS = {
+    "python basics": [1.0, 0.0],
+    "intro to python": [0.95, math.sqrt(1 - 0.95**2)],
+    "french cooking": [0.0, 1.0],
+}
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch) -> SemanticCacheAgent:
+    async def fake_embed(self: SemanticCacheAgent, text: str) -> array:
+        return array("f", EMBEDDINGS[text])
+
+    monkeypatch.setattr(SemanticCacheAgent, "_embed", fake_embed)
+    return SemanticCacheAgent(
+        name="cache",
+        db_path=str(tmp_path / "cache.db"),
+        sub_agents=[ScriptedPipeline(name="pipeline")],
+    )
+
+
+class ScriptedPipeline(BaseAgent):
+    """Stands in for the course pipeline: a verdict, then content_builder's output."""
+
+    verdict: str = "pass"
+    runs: int = 0
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        self.runs += 1
+        yield Event(
+            author="judge_and_check",
+            invocation_id=ctx.invocation_id,
+            actions=EventActions(
+                state_delta={"judge_feedback": {"status": self.verdict, "feedback": ""}}
+            ),
+        )
+        for part in [
+            types.Part(text="Outlining...", thought=True),
+            types.Part(text="Draft"),
+            types.Part(text=f"Course #{self.runs}"),
+        ]:
+            yield Event(
+                author="content_builder",
+                invocation_id=ctx.invocation_id,
+                content=types.Content(role="model", parts=[part]),
+            )
+
+
+async def ask(
+    runner: Runner, topic: str, session_id: str | None = None
+) -> tuple[str, list[Event]]:
+    """Sends a course request the way the frontend does; returns the session id and events."""
+    if session_id is None:
+        session = await runner.session_service.create_session(
+            app_name=runner.app_name, user_id="user"
+        )
+        session_id = session.id
+    message = types.Content(
+        role="user",
+        parts=[types.Part(text=f"Create a comprehensive course on: {topic}")],
+    )
+    events = [
+        event
+        async for event in runner.run_async(
+            user_id="user", session_id=session_id, new_message=message
+        )
+    ]
+    return session_id, events
+
+
+def make_runner(cache: SemanticCacheAgent) -> Runner:
+    return Runner(app_name="test", agent=cache, session_service=InMemorySessionService())
+
+
+async def lookup(cache: SemanticCacheAgent, prompt: str) -> str | None:
+    return cache._lookup(await cache._embed(prompt))
+
+
+async def store(cache: SemanticCacheAgent, prompt: str, content: str) -> None:
+    cache._store(await cache._embed(prompt), content)
+
+
+@pytest.mark.asyncio
+async def test_hit_for_similar_prompt(cache: SemanticCacheAgent) -> None:
+    assert await lookup(cache, "python basics") is None
+
+    await store(cache, "python basics", "course")
+
+    assert await lookup(cache, "python basics") == "course"
+    assert await lookup(cache, "intro to python") == "course"
+
+
+@pytest.mark.asyncio
+async def test_miss_for_unrelated_prompt(cache: SemanticCacheAgent) -> None:
+    await store(cache, "python basics", "course")
+
+    assert await lookup(cache, "french cooking") is None
+
+
+@pytest.mark.asyncio
+async def test_miss_below_threshold(cache: SemanticCacheAgent) -> None:
+    cache.similarity_threshold = 0.99
+    await store(cache, "python basics", "course")
+
+    assert await lookup(cache, "python basics") == "course"
+    assert await lookup(cache, "intro to python") is None
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_miss_and_are_purged(
+    cache: SemanticCacheAgent, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = 1_000_000.0
+    monkeypatch.setattr(semantic_cache, "time", SimpleNamespace(time=lambda: now))
+    await store(cache, "python basics", "old course")
+
+    now += cache.ttl_seconds + 1
+    assert await lookup(cache, "python basics") is None
+
+    await store(cache, "french cooking", "new course")
+    with closing(cache._connect()) as conn:
+        rows = conn.execute("SELECT content FROM course_cache").fetchall()
+    assert rows == [("new course",)]
+
+
+@pytest.mark.parametrize(
+    ("prompt", "topic"),
+    [
+        ("Create a comprehensive course on: Python basics", "Python basics"),
+        ("  create a comprehensive course on:python basics ", "python basics"),
+        ("Python basics", "Python basics"),
+    ],
+)
+def test_course_topic_drops_the_frontend_wording(prompt: str, topic: str) -> None:
+    assert course_topic(prompt) == topic
+
+
+@pytest.mark.asyncio
+async def test_similar_request_is_served_from_cache(cache: SemanticCacheAgent) -> None:
+    runner = make_runner(cache)
+    pipeline = cache.sub_agents[0]
+
+    _, events = await ask(runner, "python basics")
+    _, cached_events = await ask(runner, "intro to python")
+
+    assert pipeline.runs == 1
+    assert [e.author for e in events if e.content] == ["content_builder"] * 3
+    # Only content_builder's last non-thought text is cached
+    assert [(e.author, e.content.parts[0].text) for e in cached_events] == [
+        ("cache", "Course #1")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unrelated_request_runs_the_pipeline(cache: SemanticCacheAgent) -> None:
+    runner = make_runner(cache)
+
+    await ask(runner, "python basics")
+    await ask(runner, "french cooking")
+
+    assert cache.sub_agents[0].runs == 2
+
+
+@pytest.mark.asyncio
+async def test_course_without_a_pass_is_not_cached(cache: SemanticCacheAgent) -> None:
+    runner = make_runner(cache)
+    cache.sub_agents[0].verdict = "fail"
+
+    await ask(runner, "python basics")
+    await ask(runner, "python basics")
+
+    assert cache.sub_agents[0].runs == 2
+
+
+@pytest.mark.asyncio
+async def test_follow_up_turns_bypass_the_cache(cache: SemanticCacheAgent) -> None:
+    runner = make_runner(cache)
+    pipeline = cache.sub_agents[0]
+
+    await ask(runner, "french cooking")
+    session_id, _ = await ask(runner, "python basics")
+    # Same wording as a cached course, but in the context of this session
+    await ask(runner, "python basics", session_id=session_id)
+    await ask(runner, "french cooking", session_id=session_id)
+
+    assert pipeline.runs == 4
+    with closing(cache._connect()) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM course_cache").fetchone() == (2,)
@@ -0,0 +1,86 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+from google.adk.events import Event, EventActions
+from google.adk.sessions.base_session_service import GetSessionConfig
+from google.genai import types
+
+ROOT = Path(__file__).resolve().parents[2]
+# Each leaf service ships its own copy, since only its app/ goes into its image.
+SERVICES = ["researcher", "judge", "content_builder"]
+
+
+def load_session_service(service: str) -> type:
+    path = ROOT / service / "app" / "session_service.py"
+    spec = importlib.util.spec_from_file_location(f"{service}_session_service", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.DeltaSessionService
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("service", SERVICES)
+async def test_get_session_shares_events_and_copies_state(service: str) -> None:
+    session_service = load_session_service(service)()
+    session = await session_service.create_session(
+        app_name="app", user_id="user", session_id="session", state={"topic": {"a": 1}}
+    )
+    for i in range(3):
+        await session_service.append_event(
+            session,
+            Event(
+                author="agent",
+                invocation_id=f"inv-{i}",
+                content=types.Content(role="model", parts=[types.Part(text=str(i))]),
+                actions=EventActions(state_delta={"step": i}),
+            ),
+        )
+    stored = session_service.sessions["app"]["user"]["session"]
+
+    read = await session_service.get_session(
+        app_name="app", user_id="user", session_id="session"
+    )
+    assert read is not stored
+    assert read.events is not stored.events
+    assert all(a is b for a, b in zip(read.events, stored.events, strict=True))
+    assert read.state == {"topic": {"a": 1}, "step": 2}
+
+    read.state["topic"]["a"] = 2
+    read.events.append(read.events[0])
+    assert stored.state["topic"] == {"a": 1}
+    assert len(stored.events) == 3
+
+    recent = await session_service.get_session(
+        app_name="app",
+        user_id="user",
+        session_id="session",
+        config=GetSessionConfig(num_recent_events=2),
+    )
+    assert [e.invocation_id for e in recent.events] == ["inv-1", "inv-2"]
+    assert recent.events[0] is stored.events[1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("service", SERVICES)
+async def test_get_missing_session(service: str) -> None:
+    session_service = load_session_service(service)()
+
+    assert (
+        await session_service.get_session(app_name="app", user_id="user", session_id="x")
+        is None
+    )